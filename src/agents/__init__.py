@@ -6,17 +6,43 @@ Day 4 Implementation: All agents are now fully implemented with OpenAI GPT-4o-mi
 integration, providing production-ready AI-powered processing capabilities.
 """
 
-from .transcript_processor import process_transcript, test_transcript_processor
-from .content_analyzer import analyze_content, test_content_analyzer
-from .summary_writer import write_summary, test_summary_writer
-from .minutes_formatter import format_minutes, test_minutes_formatter, get_minutes_statistics
+import importlib
+import sys
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+# Agent submodules pull in the OpenAI client, so they are imported on first
+# attribute access (PEP 562) rather than when the package is loaded.
+_LAZY = {
+    "process_transcript": "transcript_processor",
+    "test_transcript_processor": "transcript_processor",
+    "analyze_content": "content_analyzer",
+    "analyze_content_batch": "content_analyzer",
+    "test_content_analyzer": "content_analyzer",
+    "write_summary": "summary_writer",
+    "write_summary_batch": "summary_writer",
+    "finalize_summaries_from_batch": "summary_writer",
+    "test_summary_writer": "summary_writer",
+    "format_minutes": "minutes_formatter",
+    "format_minutes_batch": "minutes_formatter",
+    "finalize_minutes_from_batch": "minutes_formatter",
+    "stream_formatted_minutes": "minutes_formatter",
+    "test_minutes_formatter": "minutes_formatter",
+    "get_minutes_statistics": "minutes_formatter",
+}
 
 __all__ = [
     # Agent functions
     "process_transcript",
     "analyze_content",
+    "analyze_content_batch",
     "write_summary",
+    "write_summary_batch",
+    "finalize_summaries_from_batch",
     "format_minutes",
+    "format_minutes_batch",
+    "finalize_minutes_from_batch",
+    "stream_formatted_minutes",
 
     # Testing functions
     "test_transcript_processor",
@@ -28,6 +54,22 @@ __all__ = [
     "get_minutes_statistics"
 ]
 
+def __getattr__(name):
+    """Import agent functions on first access."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+# Shared status/model values, interned so comparisons against them are identity checks
+_STATUS = sys.intern("ai_enhanced_complete")
+_MODEL = sys.intern("openai_gpt4o_mini")
+
 # Agent metadata for workflow information - UPDATED for Day 4
 AGENT_INFO = {
     "transcript_processor": {
@@ -35,8 +77,8 @@ AGENT_INFO = {
         "description": "AI-powered transcript cleaning and speaker identification using OpenAI GPT-4o-mini",
         "input_fields": ["raw_transcript"],
         "output_fields": ["cleaned_transcript", "speaker_identification", "transcript_quality_score", "processing_notes"],
-        "status": "ai_enhanced_complete",
-        "ai_model": "openai_gpt4o_mini",
+        "status": _STATUS,
+        "ai_model": _MODEL,
         "capabilities": ["filler_word_removal", "error_correction", "speaker_identification", "quality_assessment"]
     },
     "content_analyzer": {
@@ -44,8 +86,8 @@ AGENT_INFO = {
         "description": "AI-powered information extraction with context-aware analysis using OpenAI GPT-4o-mini",
         "input_fields": ["cleaned_transcript"],
         "output_fields": ["extracted_info", "action_items", "decisions", "key_points", "attendees", "meeting_type", "topics_discussed", "deadlines_mentioned"],
-        "status": "ai_enhanced_complete",
-        "ai_model": "openai_gpt4o_mini",
+        "status": _STATUS,
+        "ai_model": _MODEL,
         "capabilities": ["action_item_extraction", "decision_identification", "meeting_type_detection", "deadline_parsing", "context_analysis"]
     },
     "summary_writer": {
@@ -53,8 +95,8 @@ AGENT_INFO = {
         "description": "AI-powered executive summary generation with strategic business focus using OpenAI GPT-4o-mini",
         "input_fields": ["cleaned_transcript", "extracted_info", "action_items", "decisions", "key_points"],
         "output_fields": ["executive_summary", "meeting_overview", "key_outcomes", "next_steps_summary", "meeting_insights", "stakeholder_impact"],
-        "status": "ai_enhanced_complete",
-        "ai_model": "openai_gpt4o_mini",
+        "status": _STATUS,
+        "ai_model": _MODEL,
         "capabilities": ["executive_summaries", "strategic_analysis", "stakeholder_impact", "business_insights", "next_steps_planning"]
     },
     "minutes_formatter": {
@@ -62,12 +104,24 @@ AGENT_INFO = {
         "description": "AI-powered professional meeting minutes generation with corporate formatting using OpenAI GPT-4o-mini",
         "input_fields": ["executive_summary", "meeting_overview", "key_outcomes", "action_items", "decisions", "meeting_metadata"],
         "output_fields": ["formatted_minutes", "minutes_sections", "action_items_table", "decisions_list", "attendees_list"],
-        "status": "ai_enhanced_complete",
-        "ai_model": "openai_gpt4o_mini",
+        "status": _STATUS,
+        "ai_model": _MODEL,
         "capabilities": ["professional_formatting", "markdown_generation", "table_creation", "modular_sections", "executive_ready_output"]
     }
 }
 
+# Freeze the metadata so callers share it read-only; field names are interned
+# so every agent entry references the same key objects
+AGENT_INFO = types.MappingProxyType({
+    sys.intern(agent): types.MappingProxyType({
+        sys.intern(field): tuple(value) if isinstance(value, list) else value
+        for field, value in info.items()
+    })
+    for agent, info in AGENT_INFO.items()
+})
+
+_EMPTY_INFO = types.MappingProxyType({})
+
 def get_agent_info(agent_name: str = None):
     """
     Get information about agents.
@@ -76,12 +130,22 @@ def get_agent_info(agent_name: str = None):
         agent_name: Specific agent name, or None for all agents
 
     Returns:
-        Agent information dictionary
+        Read-only agent information mapping
     """
     if agent_name:
-        return AGENT_INFO.get(agent_name, {})
+        return AGENT_INFO.get(agent_name, _EMPTY_INFO)
     return AGENT_INFO
 
+_logger = None
+
+def _get_logger():
+    """Return the package logger, importing logging on first use."""
+    global _logger
+    if _logger is None:
+        import logging
+        _logger = logging.getLogger(__name__)
+    return _logger
+
 def test_all_agents():
     """
     Test all agents with sample data.
@@ -89,13 +153,16 @@ def test_all_agents():
     Returns:
         Dictionary with test results for all agents
     """
-    import logging
-
-    logger = logging.getLogger(__name__)
+    logger = _get_logger()
     logger.info("🧪 Testing all AI-enhanced agents...")
 
     results = {}
 
+    from .transcript_processor import test_transcript_processor
+    from .content_analyzer import test_content_analyzer
+    from .summary_writer import test_summary_writer
+    from .minutes_formatter import test_minutes_formatter
+
     # Test each agent with enhanced validation
     test_functions = [
         ("transcript_processor", test_transcript_processor),
@@ -104,32 +171,51 @@ def test_all_agents():
         ("minutes_formatter", test_minutes_formatter)
     ]
 
-    for agent_name, test_func in test_functions:
-        try:
+    # The agent tests are dominated by OpenAI round-trips, so run them together.
+    # No with-block: its exit would wait for a hung agent despite the timeout
+    executor = ThreadPoolExecutor(max_workers=len(test_functions))
+    try:
+        for agent_name, _ in test_functions:
             logger.info(f"Testing AI-enhanced {agent_name}...")
-            result = test_func()
-            results[agent_name] = result
+        futures = [(agent_name, executor.submit(test_func)) for agent_name, test_func in test_functions]
 
-            # Enhanced status reporting for AI agents
-            success = result.get("success", False)
-            ai_enhanced = result.get("ai_enhanced", False)
+        # Collect in declaration order so the log reads the same as a sequential run
+        for agent_name, future in futures:
+            try:
+                result = future.result(timeout=60)
+                results[agent_name] = result
 
-            if success and ai_enhanced:
-                status = "✅ PASS (AI Enhanced)"
-            elif success:
-                status = "⚠️ PASS (Fallback)"
-            else:
-                status = "❌ FAIL"
+                # Enhanced status reporting for AI agents
+                success = result.get("success", False)
+                ai_enhanced = result.get("ai_enhanced", False)
 
-            logger.info(f"{status} - {agent_name}")
+                if success and ai_enhanced:
+                    status = "✅ PASS (AI Enhanced)"
+                elif success and result.get("mock"):
+                    status = "✅ PASS (Mock client)"
+                elif success:
+                    status = "⚠️ PASS (Fallback)"
+                else:
+                    status = "❌ FAIL"
 
-        except Exception as e:
-            results[agent_name] = {"success": False, "ai_enhanced": False, "error": str(e)}
-            logger.error(f"❌ FAIL - {agent_name}: {e}")
+                logger.info(f"{status} - {agent_name}")
+
+            except TimeoutError:
+                results[agent_name] = {"success": False, "ai_enhanced": False, "error": "Timed out after 60s"}
+                logger.error(f"❌ FAIL - {agent_name}: timed out after 60s")
+            except Exception as e:
+                results[agent_name] = {"success": False, "ai_enhanced": False, "error": str(e)}
+                logger.error(f"❌ FAIL - {agent_name}: {e}")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
     # Enhanced summary with AI status
-    passed = sum(1 for r in results.values() if r.get("success"))
-    ai_enhanced = sum(1 for r in results.values() if r.get("success") and r.get("ai_enhanced"))
+    passed = ai_enhanced = 0
+    for r in results.values():
+        if r.get("success"):
+            passed += 1
+            if r.get("ai_enhanced"):
+                ai_enhanced += 1
     total = len(results)
 
     logger.info(f"Agent tests completed: {passed}/{total} passed, {ai_enhanced}/{total} AI-enhanced")
@@ -147,34 +233,37 @@ def test_all_agents():
         }
     }
 
+# Fixed status payload, built once and shared read-only
+_SYSTEM_STATUS = types.MappingProxyType({
+    "system_name": "Meeting Minutes Generator",
+    "version": "1.0.0",
+    "development_day": "Day 4 Complete",
+    "total_agents": 4,
+    "ai_enhanced_agents": 4,
+    "status": "production_ready",
+    "capabilities": (
+        "AI-powered transcript cleaning",
+        "Context-aware content extraction",
+        "Executive-level summary generation",
+        "Professional meeting minutes formatting",
+        "Multi-format export support",
+        "Real-time progress tracking",
+        "Error-resilient processing"
+    ),
+    "ai_models": types.MappingProxyType({
+        "primary": _MODEL,
+        "fallback": "pattern_matching"
+    }),
+    "output_quality": "executive_ready",
+    "processing_speed": "production_optimized",
+    "reliability": "enterprise_grade"
+})
+
 def get_system_status():
     """
     Get overall system status and capabilities.
 
     Returns:
-        System status dictionary
+        Read-only system status mapping
     """
-    return {
-        "system_name": "Meeting Minutes Generator",
-        "version": "1.0.0",
-        "development_day": "Day 4 Complete",
-        "total_agents": 4,
-        "ai_enhanced_agents": 4,
-        "status": "production_ready",
-        "capabilities": [
-            "AI-powered transcript cleaning",
-            "Context-aware content extraction",
-            "Executive-level summary generation",
-            "Professional meeting minutes formatting",
-            "Multi-format export support",
-            "Real-time progress tracking",
-            "Error-resilient processing"
-        ],
-        "ai_models": {
-            "primary": "openai_gpt4o_mini",
-            "fallback": "pattern_matching"
-        },
-        "output_quality": "executive_ready",
-        "processing_speed": "production_optimized",
-        "reliability": "enterprise_grade"
-    }
\ No newline at end of file
+    return _SYSTEM_STATUS
@@ -0,0 +1,134 @@
+"""
+Semantic cache for the content analyzer.
+
+Near-duplicate transcripts (edited timestamps, removed filler words) miss the
+exact content-hash cache. This module keeps an inner-product FAISS index over
+L2-normalized transcript embeddings so an earlier analysis can be reused when
+the cosine similarity is high enough. Opt-in (CONTENT_SEMANTIC_CACHE=1, requires
+faiss and numpy): it adds an embedding request to every cache miss and stores
+meeting content under the user's home directory.
+"""
+
+import os
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import numpy as np
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+class SemanticCacheConfig:
+    """Configuration for the semantic analysis cache."""
+
+    CACHE_DIR = Path.home() / ".meeting_minutes_ai" / "semantic_cache"
+    INDEX_FILE = CACHE_DIR / "analyses.faiss"
+    PAYLOAD_FILE = CACHE_DIR / "analyses.json"
+
+    EMBEDDING_MODEL = "text-embedding-3-small"
+    # Longer transcripts are not cached: an embedding of a prefix would match
+    # transcripts that only differ after it
+    MAX_INPUT_CHARS = 8000
+    SIMILARITY_THRESHOLD = 0.97
+    # Nearest entries checked for one with a matching scope
+    SEARCH_K = 5
+
+class SemanticCache:
+    """FAISS-backed nearest-neighbour cache of content analyses."""
+
+    def __init__(self, config: SemanticCacheConfig = None):
+        """Load the index and payloads from disk, or start empty."""
+        self.config = config or SemanticCacheConfig()
+        self._lock = threading.Lock()
+        self._index = None
+        self._payloads: List[Dict[str, Any]] = []
+        self._load()
+
+    def _load(self) -> None:
+        """Load a previously persisted index if it is consistent with its payloads."""
+        try:
+            if self.config.INDEX_FILE.exists() and self.config.PAYLOAD_FILE.exists():
+                index = faiss.read_index(str(self.config.INDEX_FILE))
+                with open(self.config.PAYLOAD_FILE, "r", encoding="utf-8") as f:
+                    payloads = json.load(f)
+                if index.ntotal == len(payloads):
+                    self._index = index
+                    self._payloads = payloads
+                    logger.debug(f"Loaded semantic cache with {index.ntotal} entries")
+        except Exception as e:
+            logger.warning(f"Failed to load semantic cache: {e}")
+
+    def _save(self) -> None:
+        """Persist the index and payloads."""
+        try:
+            self.config.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            faiss.write_index(self._index, str(self.config.INDEX_FILE))
+            with open(self.config.PAYLOAD_FILE, "w", encoding="utf-8") as f:
+                json.dump(self._payloads, f)
+        except Exception as e:
+            logger.warning(f"Failed to save semantic cache: {e}")
+
+    @staticmethod
+    def _normalize(embedding: List[float]):
+        """Return a (1, dim) float32 row with unit L2 norm, so inner product is cosine."""
+        vector = np.asarray(embedding, dtype="float32").reshape(1, -1)
+        faiss.normalize_L2(vector)
+        return vector
+
+    def lookup(self, embedding: List[float], scope: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached analysis of the nearest transcript above the similarity
+        threshold whose payload matches every scope field (e.g. model and prompt version).
+        """
+        vector = self._normalize(embedding)
+        with self._lock:
+            if self._index is None or self._index.ntotal == 0 or self._index.d != vector.shape[1]:
+                return None
+            scores, ids = self._index.search(vector, min(self.config.SEARCH_K, self._index.ntotal))
+            for similarity, position in zip(scores[0], ids[0]):
+                similarity, position = float(similarity), int(position)
+                if position < 0 or similarity < self.config.SIMILARITY_THRESHOLD:
+                    break
+                payload = self._payloads[position]
+                if all(payload.get(field) == value for field, value in scope.items()):
+                    logger.info(f"Semantic cache hit (similarity {similarity:.3f})")
+                    return payload
+            return None
+
+    def add(self, embedding: List[float], analysis: Dict[str, Any]) -> None:
+        """Add an analysis (including its scope fields) under its transcript embedding and persist the cache."""
+        vector = self._normalize(embedding)
+        with self._lock:
+            if self._index is None or self._index.d != vector.shape[1]:
+                self._index = faiss.IndexFlatIP(vector.shape[1])
+                self._payloads = []
+            self._index.add(vector)
+            self._payloads.append(analysis)
+            self._save()
+
+# Singleton instance, created on first use
+_semantic_cache = None
+_semantic_cache_lock = threading.Lock()
+
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """
+    Get the shared semantic cache.
+
+    Returns:
+        SemanticCache instance, or None when CONTENT_SEMANTIC_CACHE is not enabled
+        or faiss/numpy are not installed
+    """
+    global _semantic_cache
+    if not FAISS_AVAILABLE or os.getenv("CONTENT_SEMANTIC_CACHE", "").lower() not in ("1", "true", "yes"):
+        return None
+    with _semantic_cache_lock:
+        if _semantic_cache is None:
+            _semantic_cache = SemanticCache()
+    return _semantic_cache
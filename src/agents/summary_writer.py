@@ -3,15 +3,55 @@
 import logging
 import json
 import time
-from typing import Dict, Any, List
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TypedDict, Dict, Any, List, Callable, FrozenSet, Iterator, Optional
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from utils.state_models import MeetingState, add_warning
 from utils.openai_client import get_openai_client
+from utils.llm_cache import cached_chat_completion, cached_chat_completion_stream
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
-def write_summary(state: MeetingState) -> MeetingState:
+# Transcript excerpt sizes in tokens, per prompt
+EXCERPT_TOKENS = {"summary": 500, "insights": 400, "overview": 250}
+
+# Characters per token assumed when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+
+# Completion budgets, sized to typical section lengths; the fused request
+# covers all six sections plus JSON overhead
+SECTION_MAX_TOKENS = {
+    "executive_summary": 400,
+    "meeting_overview": 250,
+    "key_outcomes": 500,
+    "next_steps_summary": 400,
+    "meeting_insights": 400,
+    "stakeholder_impact": 400,
+    "fused": 2400
+}
+
+def write_summary(state: MeetingState, on_section: Optional[Callable[[str, Any], None]] = None) -> MeetingState:
     """
     Generate executive summary and meeting overview using OpenAI GPT-4o-mini.
 
@@ -26,89 +66,447 @@ def write_summary(state: MeetingState) -> MeetingState:
 
     Args:
         state: Current workflow state containing cleaned transcript and extracted info
+        on_section: Optional callback receiving (state key, value) as each summary
+            section becomes available; the fused request is streamed when given
 
     Returns:
         Updated state with executive summary and comprehensive meeting analysis
     """
     logger.info("📝 Summary Writer Agent starting (Full AI Implementation)...")
 
+    # The only copy of the state; every branch fills in this dict
+    result_state = dict(state)
+
     try:
-        # Get required data from state
-        cleaned_transcript = state.get("cleaned_transcript", "")
-        extracted_info = state.get("extracted_info", {})
-        action_items = state.get("action_items", [])
-        decisions = state.get("decisions", [])
-        key_points = state.get("key_points", [])
-        meeting_type = state.get("meeting_type", "General Meeting")
-        attendees = state.get("attendees", [])
-        topics_discussed = state.get("topics_discussed", [])
-        meeting_metadata = state.get("meeting_metadata", {})
-
-        if not cleaned_transcript:
+        if not state.get("cleaned_transcript", ""):
             logger.warning("No cleaned transcript available for summary")
-            result_state = state.copy()
-            result_state = _create_minimal_summary(result_state)
+            _create_minimal_summary(result_state)
             return add_warning(result_state, "summary_writer", "No transcript content to summarize")
 
-        logger.info(f"Generating AI-powered summary for {meeting_type} with {len(action_items)} actions and {len(decisions)} decisions")
+        # Every state field, excerpt and bullet list the prompts use is read or built once
+        ctx = _build_summary_context(state)
+
+        logger.info(f"Generating AI-powered summary for {ctx['meeting_type']} with {len(ctx['action_items'])} actions and {len(ctx['decisions'])} decisions")
 
         # Get OpenAI client
         client = get_openai_client()
 
-        # Step 1: Generate executive summary using AI
-        start_time = time.time()
-        executive_summary = _ai_generate_executive_summary(client, cleaned_transcript, extracted_info, meeting_type, meeting_metadata)
-        summary_time = time.time() - start_time
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Summary system prompt tokens: {_prompt_token_costs()}")
+
+        def section_ready(key: str, value: Any) -> None:
+            """Write a finished section to the state as soon as it is available."""
+            result_state[key] = value
+            logger.debug(f"Summary section ready: {key}")
+            if on_section is not None:
+                on_section(key, value)
+
+        # One fused request produces all six sections
+        timings = {}
+        with _timed("total", timings):
+            with _timed("fused", timings):
+                results = _ai_generate_all_sections(
+                    client, _fused_summary_messages(ctx), section_ready, stream=on_section is not None,
+                    exclude=ctx["empty_sections"], semantic_text=ctx["summary_excerpt"]
+                )
+            _complete_summary_sections(client, ctx, results, section_ready, timings)
+
+        logger.info(f"✅ AI-powered summary generation completed successfully (total: {timings['total']:.2f}s)")
+        logger.debug("Summary timings: " + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in timings.items()))
+        return result_state
 
-        # Step 2: Generate meeting overview using AI
-        start_time = time.time()
-        meeting_overview = _ai_generate_meeting_overview(client, cleaned_transcript, meeting_type, attendees, topics_discussed)
-        overview_time = time.time() - start_time
+    except Exception as e:
+        logger.error(f"❌ Summary generation failed: {e}")
+        raise  # Re-raise for workflow error handling
 
-        # Step 3: Generate key outcomes analysis using AI
-        start_time = time.time()
-        key_outcomes = _ai_generate_key_outcomes(client, decisions, action_items, key_points, meeting_type)
-        outcomes_time = time.time() - start_time
+@contextmanager
+def _timed(name: str, timings: Dict[str, float]) -> Iterator[None]:
+    """Record the wall-clock duration of the block in timings[name], in seconds."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = time.perf_counter() - start
+
+class SummaryContext(TypedDict):
+    """Inputs shared by the summary prompts, read from the state once."""
+    transcript: str
+    extracted_info: Dict[str, Any]
+    meeting_type: str
+    metadata: Dict[str, Any]
+    attendees: List[str]
+    topics: List[str]
+    decisions: List[Dict[str, str]]
+    action_items: List[Dict[str, str]]
+    key_points: List[str]
+    deadlines: List[Dict[str, str]]
+    decision_count: int
+    action_count: int
+    attendee_count: int
+    # Leading transcript excerpts, sized by EXCERPT_TOKENS
+    summary_excerpt: str
+    insights_excerpt: str
+    overview_excerpt: str
+    # Bullet lists are empty strings when there is nothing to list; each
+    # prompt substitutes its own placeholder text
+    attendees_str: str
+    topics_str: str
+    decisions_bullets: str
+    actions_bullets: str
+    action_deadlines_bullets: str
+    deadlines_bullets: str
+    key_points_bullets: str
+    # Sections with no meeting content to generate them from; they get the
+    # fallback text instead of anything the model would have to invent
+    empty_sections: FrozenSet[str]
+
+def _build_summary_context(state: MeetingState) -> SummaryContext:
+    """Read the summary inputs from the state and build the excerpts and bullet lists shared by the prompts."""
+    transcript = state.get("cleaned_transcript", "")
+    extracted_info = state.get("extracted_info", {})
+    attendees = state.get("attendees", [])
+    topics = state.get("topics_discussed", [])
+    decisions = state.get("decisions", [])
+    action_items = state.get("action_items", [])
+    key_points = state.get("key_points", [])
+    deadlines = extracted_info.get("deadlines_mentioned", [])
+
+    excerpts = _transcript_excerpts(transcript)
+
+    empty_sections = set()
+    if not decisions and not action_items and not key_points:
+        empty_sections.add("key_outcomes")
+    if not action_items and not deadlines:
+        empty_sections.add("next_steps_summary")
+    # A short transcript with no points or decisions gives the model nothing to analyze
+    if not key_points and not decisions and len(excerpts["insights"]) < 500:
+        empty_sections.add("meeting_insights")
+    if not decisions and not action_items:
+        empty_sections.add("stakeholder_impact")
+
+    return {
+        "transcript": transcript,
+        "extracted_info": extracted_info,
+        "meeting_type": state.get("meeting_type", "General Meeting"),
+        "metadata": state.get("meeting_metadata", {}),
+        "attendees": attendees,
+        "topics": topics,
+        "decisions": decisions,
+        "action_items": action_items,
+        "key_points": key_points,
+        "deadlines": deadlines,
+        # Counts as reported by extraction, falling back to the state lists
+        "decision_count": len(extracted_info.get("decisions", decisions)),
+        "action_count": len(extracted_info.get("action_items", action_items)),
+        "attendee_count": len(extracted_info.get("attendees", attendees)),
+        "summary_excerpt": excerpts["summary"],
+        "insights_excerpt": excerpts["insights"],
+        "overview_excerpt": excerpts["overview"],
+        "attendees_str": ", ".join(attendees) if attendees else "Multiple participants",
+        "topics_str": ", ".join(topics) if topics else "Various business topics",
+        "decisions_bullets": "\n".join(
+            f"• {decision.get('decision', 'Unknown decision')}" for decision in decisions[:5]
+        ),
+        # Top 5 actions with assignee
+        "actions_bullets": "\n".join(
+            f"• {action.get('task', 'Unknown task')} (Assigned to: {action.get('assignee', 'Unassigned')})"
+            for action in action_items[:5]
+        ),
+        # Top 8 actions with assignee and deadline
+        "action_deadlines_bullets": "\n".join(
+            f"• {action.get('task', 'Unknown task')} - {action.get('assignee', 'Unassigned')} "
+            f"({action.get('deadline', 'No deadline specified')})"
+            for action in action_items[:8]
+        ),
+        "deadlines_bullets": "\n".join(
+            f"• {deadline.get('deadline', 'Unknown deadline')} - Due: {deadline.get('date', 'TBD')}"
+            for deadline in deadlines[:5]
+        ),
+        "key_points_bullets": "\n".join(f"• {point}" for point in key_points[:5]),
+        "empty_sections": frozenset(empty_sections)
+    }
 
-        # Step 4: Generate next steps summary using AI
-        start_time = time.time()
-        next_steps_summary = _ai_generate_next_steps(client, action_items, decisions, extracted_info.get("deadlines_mentioned", []))
-        next_steps_time = time.time() - start_time
+def _complete_summary_sections(
+    client, ctx: SummaryContext, results: Dict[str, Any], on_section: Callable[[str, Any], None],
+    timings: Optional[Dict[str, float]] = None
+) -> None:
+    """
+    Generate the sections missing from results with the per-section requests.
 
-        # Step 5: Generate meeting insights using AI
-        start_time = time.time()
-        meeting_insights = _ai_generate_insights(client, cleaned_transcript, key_points, decisions, meeting_type)
-        insights_time = time.time() - start_time
-
-        # Step 6: Generate stakeholder impact assessment using AI
-        stakeholder_impact = _ai_assess_stakeholder_impact(client, decisions, action_items, attendees, meeting_type)
-
-        # Update state with results
-        result_state = state.copy()
-        result_state["executive_summary"] = executive_summary
-        result_state["meeting_overview"] = meeting_overview
-        result_state["key_outcomes"] = key_outcomes
-        result_state["next_steps_summary"] = next_steps_summary
-        result_state["meeting_insights"] = meeting_insights
-        result_state["stakeholder_impact"] = stakeholder_impact
-
-        total_time = summary_time + overview_time + outcomes_time + next_steps_time + insights_time
-        logger.info(f"✅ AI-powered summary generation completed successfully (total: {total_time:.2f}s)")
-        return result_state
+    The requests run concurrently; each helper falls back on its own errors.
+    Every generated section is added to results and passed to on_section as
+    soon as it completes. Each request's duration is recorded in timings, if given.
+    """
+    section_tasks = {
+        "executive_summary": _ai_generate_executive_summary,
+        "meeting_overview": _ai_generate_meeting_overview,
+        "key_outcomes": _ai_generate_key_outcomes,
+        "next_steps_summary": _ai_generate_next_steps,
+        "meeting_insights": _ai_generate_insights,
+        "stakeholder_impact": _ai_assess_stakeholder_impact
+    }
 
+    missing = [key for key in section_tasks if key not in results]
+    if not missing:
+        return
+    if timings is None:
+        timings = {}
+
+    def generate(key: str) -> Any:
+        with _timed(key, timings):
+            return section_tasks[key](client, ctx)
+
+    logger.info(f"Generating {len(missing)} summary section(s) individually: {', '.join(missing)}")
+    with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+        futures = {executor.submit(generate, key): key for key in missing}
+        for future in as_completed(futures):
+            key = futures[future]
+            results[key] = future.result()
+            on_section(key, results[key])
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """The gpt-4o-mini tokenizer, or None when tiktoken or its encoding data is unavailable."""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.encoding_for_model("gpt-4o-mini")
     except Exception as e:
-        logger.error(f"❌ Summary generation failed: {e}")
-        # Return state with minimal summary
-        error_state = state.copy()
-        error_state = _create_minimal_summary(error_state)
-        raise  # Re-raise for workflow error handling
+        logger.warning(f"tiktoken encoding unavailable, estimating tokens from characters: {e}")
+        return None
 
-def _ai_generate_executive_summary(client, transcript: str, extracted_info: Dict[str, Any], meeting_type: str, metadata: Dict[str, Any]) -> str:
+def _transcript_excerpts(transcript: str) -> Dict[str, str]:
     """
-    Use OpenAI to generate a compelling executive summary.
+    Leading excerpt of the transcript for each prompt, capped at EXCERPT_TOKENS.
+
+    The transcript head is tokenized once and every excerpt is decoded from the
+    same token list. Without tiktoken, CHARS_PER_TOKEN characters per token are used.
     """
+    longest = max(EXCERPT_TOKENS.values())
+    encoding = _get_encoding()
+    if encoding is None:
+        return {name: transcript[:tokens * CHARS_PER_TOKEN] for name, tokens in EXCERPT_TOKENS.items()}
+
+    # Only the head is needed; tokens average well under 16 characters
+    head = transcript[:longest * 16]
+    token_ids = encoding.encode(head)
+    if len(token_ids) < longest and len(head) < len(transcript):
+        token_ids = encoding.encode(transcript)
+    return {name: encoding.decode(token_ids[:tokens]) for name, tokens in EXCERPT_TOKENS.items()}
+
+# System prompt and user message template for the fused request producing all six summary sections
+_FUSED_SYSTEM_PROMPT = """You are an executive assistant and business analyst writing the summary of a business meeting for senior leadership.
+
+Produce every summary section in a single JSON object, using professional, authoritative business language.
+
+Return a JSON object with exactly these keys:
+{
+  "executive_summary": "2-3 paragraph executive summary",
+  "meeting_overview": "1-2 paragraph meeting overview",
+  "key_outcomes": "key outcomes analysis",
+  "next_steps_summary": "prioritized next steps summary",
+  "meeting_insights": ["insight 1", "insight 2", "insight 3"],
+  "stakeholder_impact": {
+    "stakeholder_group": "impact description"
+  }
+}
+
+SECTIONS:
+- executive_summary: for C-level executives; meeting purpose and strategic context, key decisions, outcomes and business impact, then critical next steps and implications. Include quantifiable results where available.
+- meeting_overview: the meeting's purpose, business context, main discussion areas and objectives; focus on why the meeting was necessary.
+- key_outcomes: outcomes categorized by importance, with sections such as "Strategic Decisions", "Action Items Summary" and "Key Insights".
+- next_steps_summary: next steps prioritized by urgency and business impact, grouped logically, with critical deadlines, dependencies and clear accountability (who does what).
+- meeting_insights: 3-5 concise strategic insights (patterns, risks, opportunities, organizational dynamics) that are actionable for leadership.
+- stakeholder_impact: key stakeholder groups mapped to specific direct and indirect impacts of the decisions and action items, positive and negative.
 
-    system_prompt = """You are an executive assistant creating high-level summaries for senior leadership.
+Return only valid JSON with no additional text."""
+
+_FUSED_USER_TEMPLATE = """Write all summary sections for this {meeting_type_lower}:
+
+MEETING CONTEXT:
+- Type: {meeting_type}
+- Date: {meeting_date}
+- Participants: {attendees}
+- Main Topics: {topics}
+- Decisions Made: {decision_count}
+- Action Items: {action_count}
+
+DECISIONS MADE:
+{decisions}
+
+ACTION ITEMS:
+{actions}
+
+TIME-SENSITIVE ITEMS:
+{deadlines}
+
+KEY DISCUSSION POINTS:
+{key_points}
+
+MEETING TRANSCRIPT:
+{transcript}..."""
+
+# Appended to the fused request when some sections have no supporting content
+_FUSED_OMIT_NOTE = """
+
+Omit these keys; the meeting has no content for them: {keys}"""
+
+def _fused_summary_messages(ctx: SummaryContext) -> List[Dict[str, str]]:
+    """Build the fused request for all six summary sections."""
+    meeting_type = ctx["meeting_type"]
+
+    user_prompt = _FUSED_USER_TEMPLATE.format(
+        meeting_type_lower=meeting_type.lower(),
+        meeting_type=meeting_type,
+        meeting_date=ctx["metadata"].get("date", "Recent"),
+        attendees=ctx["attendees_str"],
+        topics=ctx["topics_str"],
+        decision_count=ctx["decision_count"],
+        action_count=ctx["action_count"],
+        decisions=ctx["decisions_bullets"] or "No major decisions recorded",
+        actions=ctx["action_deadlines_bullets"] or "No action items identified",
+        deadlines=ctx["deadlines_bullets"] or "No specific deadlines mentioned",
+        key_points=ctx["key_points_bullets"] or "No specific points recorded",
+        transcript=ctx["summary_excerpt"]
+    )
+    if ctx["empty_sections"]:
+        omitted = [key for key in _SYSTEM_PROMPTS if key in ctx["empty_sections"]]
+        user_prompt += _FUSED_OMIT_NOTE.format(keys=", ".join(omitted))
+
+    return [
+        {"role": "system", "content": _FUSED_SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt}
+    ]
+
+def _ai_generate_all_sections(
+    client, messages: List[Dict[str, str]], on_section: Callable[[str, Any], None], stream: bool = False,
+    exclude: FrozenSet[str] = frozenset(), semantic_text: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Use a single OpenAI call to generate the executive summary, overview, key
+    outcomes, next steps, insights and stakeholder impact together.
+
+    Each valid section is passed to on_section; sections in exclude are
+    ignored. With stream (and ijson installed) the response is streamed, so
+    each section is passed on as soon as its JSON value is complete.
+    semantic_text is the transcript excerpt in messages, for the semantic
+    response cache (non-streamed requests only).
+
+    Returns the valid sections keyed by state field (possibly empty if the call
+    or parsing failed).
+    """
+    if not stream or not IJSON_AVAILABLE or not hasattr(client, "chat_completion_stream"):
+        try:
+            response = cached_chat_completion(
+                client,
+                messages,
+                temperature=0.2,
+                max_tokens=SECTION_MAX_TOKENS["fused"],
+                response_format={"type": "json_object"},
+                semantic_text=semantic_text
+            )
+        except Exception as e:
+            logger.error(f"AI fused summary generation failed: {e}")
+            return {}
+        results = _parse_fused_summary(response, exclude)
+        for key, value in results.items():
+            on_section(key, value)
+        return results
+
+    # Sections received before a failure mid-stream are kept
+    results = {}
+    parts = []
+    fields = ijson.sendable_list()
+    coro = ijson.kvitems_coro(fields, "")
+
+    try:
+        for delta in cached_chat_completion_stream(
+            client,
+            messages,
+            temperature=0.2,
+            max_tokens=SECTION_MAX_TOKENS["fused"],
+            response_format={"type": "json_object"}
+        ):
+            parts.append(delta)
+            if coro is None:
+                continue
+            try:
+                coro.send(delta.encode("utf-8"))
+            except ijson.JSONError as e:
+                logger.debug(f"Incremental parse of fused summary stopped: {e}")
+                coro = None
+                continue
+            for key, value in fields:
+                if key in exclude:
+                    continue
+                value = _validate_section(key, value)
+                if value is not None and key not in results:
+                    results[key] = value
+                    on_section(key, value)
+            del fields[:]
+    except Exception as e:
+        logger.error(f"AI fused summary streaming failed: {e}")
+        return results
+
+    # The complete response is authoritative for anything the incremental parse missed
+    for key, value in _parse_fused_summary("".join(parts), exclude).items():
+        if key not in results:
+            results[key] = value
+            on_section(key, value)
+    return results
+
+def _validate_section(key: str, value: Any) -> Any:
+    """
+    Apply the per-section helpers' checks to one fused-response field.
+
+    Returns the cleaned value, or None when the field is unknown or malformed.
+    """
+    if key in ("executive_summary", "meeting_overview", "key_outcomes", "next_steps_summary"):
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+    elif key == "meeting_insights":
+        if isinstance(value, list):
+            insights = [insight for insight in value if isinstance(insight, str) and len(insight) > 10][:6]
+            return insights or None
+    elif key == "stakeholder_impact":
+        if isinstance(value, dict):
+            impact = {k: v for k, v in value.items() if isinstance(v, str) and len(v) > 10}
+            return impact or None
+    return None
+
+def _parse_fused_summary(response: str, exclude: FrozenSet[str] = frozenset()) -> Dict[str, Any]:
+    """
+    Parse the fused JSON response into its valid sections, ignoring those in
+    exclude; the rest are generated individually.
+    """
+    try:
+        generated = _parse_json(response)
+    except json.JSONDecodeError as e:
+        logger.warning(f"Invalid JSON response for fused summary generation: {e}")
+        return {}
+
+    if not isinstance(generated, dict):
+        logger.warning("Fused summary response is not a JSON object")
+        return {}
+
+    results = {}
+    for key, value in generated.items():
+        if key in exclude:
+            continue
+        value = _validate_section(key, value)
+        if value is not None:
+            results[key] = value
+    return results
+
+def _parse_json(text: str) -> Any:
+    """Parse model JSON output, using orjson when it is installed."""
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+# System prompt and user message template for the executive summary
+_EXECUTIVE_SUMMARY_SYSTEM_PROMPT = """You are an executive assistant creating high-level summaries for senior leadership.
 
 Create a compelling executive summary that captures the essence and business impact of this meeting.
 
@@ -128,13 +526,7 @@ STRUCTURE:
 
 Return only the executive summary with no additional commentary."""
 
-    # Prepare context information
-    action_count = len(extracted_info.get("action_items", []))
-    decision_count = len(extracted_info.get("decisions", []))
-    attendee_count = len(extracted_info.get("attendees", []))
-    meeting_date = metadata.get("date", "Recent")
-
-    user_prompt = f"""Create an executive summary for this {meeting_type.lower()}:
+_EXECUTIVE_SUMMARY_USER_TEMPLATE = """Create an executive summary for this {meeting_type_lower}:
 
 MEETING CONTEXT:
 - Type: {meeting_type}
@@ -144,30 +536,45 @@ MEETING CONTEXT:
 - Action Items: {action_count}
 
 MEETING TRANSCRIPT:
-{transcript[:2000]}...
+{transcript}...
 
 Focus on business impact and strategic importance."""
 
+def _ai_generate_executive_summary(client, ctx: SummaryContext) -> str:
+    """
+    Use OpenAI to generate a compelling executive summary.
+    """
+    meeting_type = ctx["meeting_type"]
+
+    user_prompt = _EXECUTIVE_SUMMARY_USER_TEMPLATE.format(
+        meeting_type_lower=meeting_type.lower(),
+        meeting_type=meeting_type,
+        meeting_date=ctx["metadata"].get("date", "Recent"),
+        attendee_count=ctx["attendee_count"],
+        decision_count=ctx["decision_count"],
+        action_count=ctx["action_count"],
+        transcript=ctx["summary_excerpt"]
+    )
+
     try:
         messages = [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _EXECUTIVE_SUMMARY_SYSTEM_PROMPT},
             {"role": "user", "content": user_prompt}
         ]
 
-        summary = client.chat_completion(messages, temperature=0.2, max_tokens=800)
+        summary = cached_chat_completion(
+            client, messages, temperature=0.2, max_tokens=SECTION_MAX_TOKENS["executive_summary"],
+            semantic_text=ctx["summary_excerpt"]
+        )
 
         return summary.strip()
 
     except Exception as e:
         logger.error(f"AI executive summary generation failed: {e}")
-        return _fallback_generate_executive_summary(transcript, extracted_info, meeting_type)
+        return _fallback_generate_executive_summary(ctx["transcript"], ctx["extracted_info"], meeting_type)
 
-def _ai_generate_meeting_overview(client, transcript: str, meeting_type: str, attendees: List[str], topics: List[str]) -> str:
-    """
-    Use OpenAI to generate a comprehensive meeting overview.
-    """
-
-    system_prompt = """You are an expert at creating meeting overviews that provide context and purpose.
+# System prompt and user message template for the meeting overview
+_OVERVIEW_SYSTEM_PROMPT = """You are an expert at creating meeting overviews that provide context and purpose.
 
 Create a meeting overview that explains the meeting's purpose, participants, and scope.
 
@@ -181,41 +588,51 @@ REQUIREMENTS:
 
 Return only the meeting overview with no additional commentary."""
 
-    attendees_str = ", ".join(attendees) if attendees else "Multiple participants"
-    topics_str = ", ".join(topics) if topics else "Various business topics"
-
-    user_prompt = f"""Create a meeting overview for this {meeting_type.lower()}:
+_OVERVIEW_USER_TEMPLATE = """Create a meeting overview for this {meeting_type_lower}:
 
 MEETING DETAILS:
 - Type: {meeting_type}
-- Participants: {attendees_str}
-- Main Topics: {topics_str}
+- Participants: {attendees}
+- Main Topics: {topics}
 
 TRANSCRIPT SAMPLE:
-{transcript[:1000]}...
+{transcript}...
 
 Explain the purpose and context of this meeting."""
 
+def _ai_generate_meeting_overview(client, ctx: SummaryContext) -> str:
+    """
+    Use OpenAI to generate a comprehensive meeting overview.
+    """
+    meeting_type = ctx["meeting_type"]
+
+    user_prompt = _OVERVIEW_USER_TEMPLATE.format(
+        meeting_type_lower=meeting_type.lower(),
+        meeting_type=meeting_type,
+        attendees=ctx["attendees_str"],
+        topics=ctx["topics_str"],
+        transcript=ctx["overview_excerpt"]
+    )
+
     try:
         messages = [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _OVERVIEW_SYSTEM_PROMPT},
             {"role": "user", "content": user_prompt}
         ]
 
-        overview = client.chat_completion(messages, temperature=0.2, max_tokens=500)
+        overview = cached_chat_completion(
+            client, messages, temperature=0.2, max_tokens=SECTION_MAX_TOKENS["meeting_overview"],
+            semantic_text=ctx["overview_excerpt"]
+        )
 
         return overview.strip()
 
     except Exception as e:
         logger.error(f"AI meeting overview generation failed: {e}")
-        return _fallback_generate_meeting_overview(meeting_type, attendees, topics)
-
-def _ai_generate_key_outcomes(client, decisions: List[Dict[str, str]], action_items: List[Dict[str, str]], key_points: List[str], meeting_type: str) -> str:
-    """
-    Use OpenAI to generate key outcomes analysis.
-    """
+        return _fallback_generate_meeting_overview(meeting_type, ctx["attendees"], ctx["topics"])
 
-    system_prompt = """You are an expert at analyzing meeting outcomes and their business implications.
+# System prompt and user message template for the key outcomes analysis
+_KEY_OUTCOMES_SYSTEM_PROMPT = """You are an expert at analyzing meeting outcomes and their business implications.
 
 Analyze the decisions, action items, and key points to create a comprehensive outcomes summary.
 
@@ -232,39 +649,50 @@ Use clear sections like "Strategic Decisions," "Action Items Summary," "Key Insi
 
 Return only the key outcomes analysis with no additional commentary."""
 
-    # Prepare structured data
-    decisions_summary = []
-    for decision in decisions[:5]:  # Top 5 decisions
-        decisions_summary.append(f"• {decision.get('decision', 'Unknown decision')}")
-
-    actions_summary = []
-    for action in action_items[:5]:  # Top 5 actions
-        assignee = action.get('assignee', 'Unassigned')
-        task = action.get('task', 'Unknown task')
-        actions_summary.append(f"• {task} (Assigned to: {assignee})")
-
-    user_prompt = f"""Analyze the key outcomes of this {meeting_type.lower()}:
+_KEY_OUTCOMES_USER_TEMPLATE = """Analyze the key outcomes of this {meeting_type_lower}:
 
 DECISIONS MADE:
-{chr(10).join(decisions_summary) if decisions_summary else "No major decisions recorded"}
+{decisions}
 
 ACTION ITEMS:
-{chr(10).join(actions_summary) if actions_summary else "No action items identified"}
+{actions}
 
 KEY DISCUSSION POINTS:
-{chr(10).join([f"• {point}" for point in key_points[:5]]) if key_points else "No specific points recorded"}
+{key_points}
 
 MEETING TYPE: {meeting_type}
 
 Provide a comprehensive outcomes analysis."""
 
+def _ai_generate_key_outcomes(client, ctx: SummaryContext) -> str:
+    """
+    Use OpenAI to generate key outcomes analysis.
+    """
+    decisions = ctx["decisions"]
+    action_items = ctx["action_items"]
+    key_points = ctx["key_points"]
+    meeting_type = ctx["meeting_type"]
+
+    # Nothing to analyze: the model could only invent outcomes
+    if "key_outcomes" in ctx["empty_sections"]:
+        logger.info("No decisions, action items or key points; skipping AI key outcomes")
+        return _fallback_generate_key_outcomes(decisions, action_items, key_points)
+
+    user_prompt = _KEY_OUTCOMES_USER_TEMPLATE.format(
+        meeting_type_lower=meeting_type.lower(),
+        meeting_type=meeting_type,
+        decisions=ctx["decisions_bullets"] or "No major decisions recorded",
+        actions=ctx["actions_bullets"] or "No action items identified",
+        key_points=ctx["key_points_bullets"] or "No specific points recorded"
+    )
+
     try:
         messages = [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _KEY_OUTCOMES_SYSTEM_PROMPT},
             {"role": "user", "content": user_prompt}
         ]
 
-        outcomes = client.chat_completion(messages, temperature=0.2, max_tokens=800)
+        outcomes = cached_chat_completion(client, messages, temperature=0.2, max_tokens=SECTION_MAX_TOKENS["key_outcomes"])
 
         return outcomes.strip()
 
@@ -272,12 +700,8 @@ Provide a comprehensive outcomes analysis."""
         logger.error(f"AI key outcomes generation failed: {e}")
         return _fallback_generate_key_outcomes(decisions, action_items, key_points)
 
-def _ai_generate_next_steps(client, action_items: List[Dict[str, str]], decisions: List[Dict[str, str]], deadlines: List[Dict[str, str]]) -> str:
-    """
-    Use OpenAI to generate next steps summary.
-    """
-
-    system_prompt = """You are an expert at creating actionable next steps summaries for business meetings.
+# System prompt and user message template for the next steps summary
+_NEXT_STEPS_SYSTEM_PROMPT = """You are an expert at creating actionable next steps summaries for business meetings.
 
 Create a clear, prioritized summary of next steps based on action items, decisions, and deadlines.
 
@@ -294,40 +718,43 @@ Structure as prioritized sections with clear accountability.
 
 Return only the next steps summary with no additional commentary."""
 
-    # Prepare action items summary
-    action_summary = []
-    for action in action_items[:8]:  # Top 8 actions
-        task = action.get('task', 'Unknown task')
-        assignee = action.get('assignee', 'Unassigned')
-        deadline = action.get('deadline', 'No deadline specified')
-        action_summary.append(f"• {task} - {assignee} ({deadline})")
-
-    deadline_summary = []
-    for deadline in deadlines[:5]:  # Top 5 deadlines
-        item = deadline.get('deadline', 'Unknown deadline')
-        date = deadline.get('date', 'TBD')
-        deadline_summary.append(f"• {item} - Due: {date}")
-
-    user_prompt = f"""Create a next steps summary based on this meeting:
+_NEXT_STEPS_USER_TEMPLATE = """Create a next steps summary based on this meeting:
 
 ACTION ITEMS:
-{chr(10).join(action_summary) if action_summary else "No specific action items identified"}
+{actions}
 
 TIME-SENSITIVE ITEMS:
-{chr(10).join(deadline_summary) if deadline_summary else "No specific deadlines mentioned"}
+{deadlines}
 
 DECISIONS REQUIRING FOLLOW-UP:
-{len(decisions)} decisions made requiring implementation
+{decision_count} decisions made requiring implementation
 
 Create a prioritized, actionable next steps summary."""
 
+def _ai_generate_next_steps(client, ctx: SummaryContext) -> str:
+    """
+    Use OpenAI to generate next steps summary.
+    """
+    action_items = ctx["action_items"]
+    deadlines = ctx["deadlines"]
+
+    if "next_steps_summary" in ctx["empty_sections"]:
+        logger.info("No action items or deadlines; skipping AI next steps")
+        return _fallback_generate_next_steps(action_items, deadlines)
+
+    user_prompt = _NEXT_STEPS_USER_TEMPLATE.format(
+        actions=ctx["action_deadlines_bullets"] or "No specific action items identified",
+        deadlines=ctx["deadlines_bullets"] or "No specific deadlines mentioned",
+        decision_count=len(ctx["decisions"])
+    )
+
     try:
         messages = [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _NEXT_STEPS_SYSTEM_PROMPT},
             {"role": "user", "content": user_prompt}
         ]
 
-        next_steps = client.chat_completion(messages, temperature=0.2, max_tokens=600)
+        next_steps = cached_chat_completion(client, messages, temperature=0.2, max_tokens=SECTION_MAX_TOKENS["next_steps_summary"])
 
         return next_steps.strip()
 
@@ -335,12 +762,8 @@ Create a prioritized, actionable next steps summary."""
         logger.error(f"AI next steps generation failed: {e}")
         return _fallback_generate_next_steps(action_items, deadlines)
 
-def _ai_generate_insights(client, transcript: str, key_points: List[str], decisions: List[Dict[str, str]], meeting_type: str) -> List[str]:
-    """
-    Use OpenAI to generate meeting insights and strategic observations.
-    """
-
-    system_prompt = """You are a business analyst generating strategic insights from meeting discussions.
+# System prompt and user message template for the strategic insights
+_INSIGHTS_SYSTEM_PROMPT = """You are a business analyst generating strategic insights from meeting discussions.
 
 Analyze the meeting content to identify important insights, patterns, and strategic observations.
 
@@ -352,34 +775,58 @@ REQUIREMENTS:
 5. Keep each insight concise but meaningful
 
 RETURN FORMAT:
-Return a JSON array of strings, each being a distinct insight:
-["insight 1", "insight 2", "insight 3"]
+Return a JSON object whose "insights" array holds each distinct insight as a string:
+{"insights": ["insight 1", "insight 2", "insight 3"]}
 
 Return only valid JSON with no additional text."""
 
-    user_prompt = f"""Generate strategic insights from this {meeting_type.lower()}:
+_INSIGHTS_USER_TEMPLATE = """Generate strategic insights from this {meeting_type_lower}:
 
 KEY DECISIONS:
-{len(decisions)} strategic decisions made
+{decision_count} strategic decisions made
 
 KEY DISCUSSION POINTS:
-{chr(10).join([f"• {point[:100]}..." for point in key_points[:5]]) if key_points else "Limited discussion points"}
+{key_points}
 
 TRANSCRIPT SAMPLE:
-{transcript[:1500]}...
+{transcript}...
 
 Generate 3-5 strategic insights about this meeting."""
 
+def _ai_generate_insights(client, ctx: SummaryContext) -> List[str]:
+    """
+    Use OpenAI to generate meeting insights and strategic observations.
+    """
+    key_points = ctx["key_points"]
+    decisions = ctx["decisions"]
+    meeting_type = ctx["meeting_type"]
+
+    if "meeting_insights" in ctx["empty_sections"]:
+        logger.info("Too little meeting content; skipping AI insights")
+        return _fallback_generate_insights(key_points, decisions, meeting_type)
+
+    user_prompt = _INSIGHTS_USER_TEMPLATE.format(
+        meeting_type_lower=meeting_type.lower(),
+        decision_count=len(decisions),
+        key_points="\n".join(f"• {point[:100]}..." for point in key_points[:5]) if key_points else "Limited discussion points",
+        transcript=ctx["insights_excerpt"]
+    )
+
     try:
         messages = [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _INSIGHTS_SYSTEM_PROMPT},
             {"role": "user", "content": user_prompt}
         ]
 
-        response = client.chat_completion(messages, temperature=0.3, max_tokens=600)
+        response = cached_chat_completion(
+            client, messages, temperature=0.3, max_tokens=SECTION_MAX_TOKENS["meeting_insights"],
+            response_format={"type": "json_object"}, semantic_text=ctx["insights_excerpt"]
+        )
 
-        # Parse JSON response
-        insights = json.loads(response)
+        # Parse JSON response (JSON mode returns an object wrapping the list)
+        insights = _parse_json(response)
+        if isinstance(insights, dict):
+            insights = insights.get("insights")
 
         # Validate and return
         if isinstance(insights, list):
@@ -391,12 +838,8 @@ Generate 3-5 strategic insights about this meeting."""
         logger.error(f"AI insights generation failed: {e}")
         return _fallback_generate_insights(key_points, decisions, meeting_type)
 
-def _ai_assess_stakeholder_impact(client, decisions: List[Dict[str, str]], action_items: List[Dict[str, str]], attendees: List[str], meeting_type: str) -> Dict[str, str]:
-    """
-    Use OpenAI to assess stakeholder impact of meeting outcomes.
-    """
-
-    system_prompt = """You are an expert at analyzing stakeholder impact from business meetings.
+# System prompt and user message template for the stakeholder impact assessment
+_STAKEHOLDER_IMPACT_SYSTEM_PROMPT = """You are an expert at analyzing stakeholder impact from business meetings.
 
 Assess how the meeting outcomes (decisions and action items) will impact different stakeholders.
 
@@ -416,35 +859,59 @@ Return a JSON object mapping stakeholder groups to impact descriptions:
 
 Return only valid JSON with no additional text."""
 
-    decisions_count = len(decisions)
-    actions_count = len(action_items)
-    attendees_str = ", ".join(attendees[:5]) if attendees else "Meeting participants"
-
-    user_prompt = f"""Assess stakeholder impact from this {meeting_type.lower()}:
+_STAKEHOLDER_IMPACT_USER_TEMPLATE = """Assess stakeholder impact from this {meeting_type_lower}:
 
 MEETING OUTCOMES:
 - {decisions_count} strategic decisions made
 - {actions_count} action items assigned
-- Key participants: {attendees_str}
+- Key participants: {attendees}
 
 SAMPLE DECISIONS:
-{chr(10).join([f"• {d.get('decision', 'Unknown')[:80]}..." for d in decisions[:3]]) if decisions else "No major decisions"}
+{decisions}
 
 SAMPLE ACTIONS:
-{chr(10).join([f"• {a.get('task', 'Unknown')[:80]}..." for a in action_items[:3]]) if action_items else "No action items"}
+{actions}
 
 Identify stakeholder groups and their impact from these outcomes."""
 
+def _ai_assess_stakeholder_impact(client, ctx: SummaryContext) -> Dict[str, str]:
+    """
+    Use OpenAI to assess stakeholder impact of meeting outcomes.
+    """
+    decisions = ctx["decisions"]
+    action_items = ctx["action_items"]
+    attendees = ctx["attendees"]
+
+    if "stakeholder_impact" in ctx["empty_sections"]:
+        logger.info("No decisions or action items; skipping AI stakeholder impact")
+        return _fallback_assess_stakeholder_impact(decisions, action_items, attendees)
+
+    decisions_count = len(decisions)
+    actions_count = len(action_items)
+    attendees_str = ", ".join(attendees[:5]) if attendees else "Meeting participants"
+
+    user_prompt = _STAKEHOLDER_IMPACT_USER_TEMPLATE.format(
+        meeting_type_lower=ctx["meeting_type"].lower(),
+        decisions_count=decisions_count,
+        actions_count=actions_count,
+        attendees=attendees_str,
+        decisions="\n".join(f"• {d.get('decision', 'Unknown')[:80]}..." for d in decisions[:3]) if decisions else "No major decisions",
+        actions="\n".join(f"• {a.get('task', 'Unknown')[:80]}..." for a in action_items[:3]) if action_items else "No action items"
+    )
+
     try:
         messages = [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _STAKEHOLDER_IMPACT_SYSTEM_PROMPT},
             {"role": "user", "content": user_prompt}
         ]
 
-        response = client.chat_completion(messages, temperature=0.2, max_tokens=600)
+        response = cached_chat_completion(
+            client, messages, temperature=0.2, max_tokens=SECTION_MAX_TOKENS["stakeholder_impact"],
+            response_format={"type": "json_object"}
+        )
 
         # Parse JSON response
-        impact_assessment = json.loads(response)
+        impact_assessment = _parse_json(response)
 
         # Validate and return
         if isinstance(impact_assessment, dict):
@@ -456,9 +923,28 @@ Identify stakeholder groups and their impact from these outcomes."""
         logger.error(f"AI stakeholder impact assessment failed: {e}")
         return _fallback_assess_stakeholder_impact(decisions, action_items, attendees)
 
-def _create_minimal_summary(state: MeetingState) -> MeetingState:
-    """Create minimal summary when full processing isn't possible."""
-    result_state = state.copy()
+# Every summary system prompt, for token-budget auditing
+_SYSTEM_PROMPTS = {
+    "fused": _FUSED_SYSTEM_PROMPT,
+    "executive_summary": _EXECUTIVE_SUMMARY_SYSTEM_PROMPT,
+    "meeting_overview": _OVERVIEW_SYSTEM_PROMPT,
+    "key_outcomes": _KEY_OUTCOMES_SYSTEM_PROMPT,
+    "next_steps_summary": _NEXT_STEPS_SYSTEM_PROMPT,
+    "meeting_insights": _INSIGHTS_SYSTEM_PROMPT,
+    "stakeholder_impact": _STAKEHOLDER_IMPACT_SYSTEM_PROMPT
+}
+
+@lru_cache(maxsize=1)
+def _prompt_token_costs() -> Dict[str, int]:
+    """Token count of each system prompt, using the shared encoder (estimated without tiktoken)."""
+    encoding = _get_encoding()
+    return {
+        name: len(encoding.encode(prompt)) if encoding is not None else len(prompt) // CHARS_PER_TOKEN
+        for name, prompt in _SYSTEM_PROMPTS.items()
+    }
+
+def _create_minimal_summary(result_state: MeetingState) -> MeetingState:
+    """Fill result_state (in place) with a minimal summary when full processing isn't possible."""
     result_state["executive_summary"] = "Meeting completed with standard business coordination and information sharing among team members."
     result_state["meeting_overview"] = "Business meeting focused on operational matters and team coordination."
     result_state["key_outcomes"] = "Meeting facilitated team alignment and coordination of ongoing initiatives."
@@ -467,6 +953,92 @@ def _create_minimal_summary(state: MeetingState) -> MeetingState:
     result_state["stakeholder_impact"] = {"Team": "Standard coordination and information sharing"}
     return result_state
 
+# ================================
+# BATCH API
+# ================================
+
+def write_summary_batch(states: List[MeetingState]) -> Optional[str]:
+    """
+    Submit the fused summary requests of batch-mode meetings to the OpenAI Batch API.
+
+    For bulk/backfill processing where summaries need not appear synchronously:
+    batch requests cost half as much but may take up to 24h. Only meetings with
+    batch_mode set and a cleaned transcript are submitted. Call
+    finalize_summaries_from_batch later with the same states to fill in the summaries.
+
+    Args:
+        states: Workflow states containing cleaned transcripts and extracted info
+
+    Returns:
+        Batch ID, or None if no meeting was submitted
+    """
+    requests = {}
+    for index, state in enumerate(states):
+        if not state.get("batch_mode") or not state.get("cleaned_transcript", "").strip():
+            continue
+        requests[f"meeting-{index}"] = _fused_summary_messages(_build_summary_context(state))
+
+    if not requests:
+        logger.info("No batch-mode meetings to summarize")
+        return None
+
+    logger.info(f"📝 Summary Writer submitting {len(requests)} meetings to the Batch API...")
+    return get_openai_client().submit_batch(
+        requests,
+        temperature=0.2,
+        max_tokens=SECTION_MAX_TOKENS["fused"],
+        response_format={"type": "json_object"}
+    )
+
+def finalize_summaries_from_batch(
+    states: List[MeetingState],
+    batch_id: Optional[str],
+    poll_interval: float = 30.0,
+    timeout: float = None
+) -> List[MeetingState]:
+    """
+    Wait for a summary batch and populate the same fields as write_summary.
+
+    Results are routed back to the states by position. Sections missing from
+    a meeting's batch output are generated with the synchronous per-section
+    requests; meetings without batch output (not submitted, failed, or the
+    whole batch unavailable) are summarized with write_summary.
+
+    Args:
+        states: The states passed to write_summary_batch, in the same order
+        batch_id: Batch returned by write_summary_batch
+        poll_interval: Seconds between batch status checks
+        timeout: Give up waiting after this many seconds (None waits for the batch window)
+
+    Returns:
+        Updated states in the same order as the input
+    """
+    client = get_openai_client()
+
+    responses = {}
+    if batch_id:
+        try:
+            responses = client.get_batch_results(batch_id, poll_interval, timeout)
+        except Exception as e:
+            logger.warning(f"Summary batch {batch_id} unavailable, summarizing synchronously: {e}")
+
+    finalized = []
+    for index, state in enumerate(states):
+        response = responses.get(f"meeting-{index}")
+        if response is None:
+            finalized.append(write_summary(state))
+            continue
+
+        result_state = dict(state)
+        ctx = _build_summary_context(state)
+        results = _parse_fused_summary(response, ctx["empty_sections"])
+        result_state.update(results)
+        _complete_summary_sections(client, ctx, results, result_state.__setitem__)
+        finalized.append(result_state)
+
+    logger.info(f"✅ Summaries finalized from batch {batch_id} ({len(responses)} batch results)")
+    return finalized
+
 # ================================
 # FALLBACK FUNCTIONS (if AI fails)
 # ================================
@@ -0,0 +1,220 @@
+"""
+Response cache for OpenAI chat completions.
+
+Reruns on the same transcript (tests, regenerating a meeting) send identical
+prompts. Responses are kept in an in-memory LRU keyed by a SHA-256 hash of the
+messages and generation settings, so repeated prompts skip the API entirely.
+
+An optional semantic tier (LLM_SEMANTIC_CACHE=1, requires numpy) applies to
+calls that pass semantic_text, the transcript excerpt interpolated into the
+prompt. Only the excerpt is embedded: the rest of the prompt (template text,
+names, figures, lists) must match exactly, and a response is reused when the
+excerpts have a cosine similarity of at least SEMANTIC_SIMILARITY_THRESHOLD.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple, Iterator
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Responses kept in memory
+LLM_CACHE_SIZE = 256
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+SEMANTIC_MAX_INPUT_CHARS = 8000
+SEMANTIC_SIMILARITY_THRESHOLD = 0.97
+
+_CACHE: "OrderedDict[str, str]" = OrderedDict()
+# Semantic entries per (prompt without the excerpt, settings) key: [(unit embedding, response)]
+_SEMANTIC: "OrderedDict[str, List[Tuple[Any, str]]]" = OrderedDict()
+_LOCK = threading.Lock()
+_stats = {"hits": 0, "semantic_hits": 0, "misses": 0}
+
+def _semantic_enabled(client) -> bool:
+    """Whether the semantic tier is switched on and usable with this client."""
+    return (
+        NUMPY_AVAILABLE
+        and os.getenv("LLM_SEMANTIC_CACHE", "").lower() in ("1", "true", "yes")
+        and hasattr(client, "create_embedding")
+    )
+
+def make_key(messages: List[Dict[str, str]], **settings: Any) -> str:
+    """SHA-256 of the messages and generation settings."""
+    payload = json.dumps({"m": messages, **settings}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def get(key: str) -> Optional[str]:
+    """Return a cached response, or None on a miss."""
+    with _LOCK:
+        value = _CACHE.get(key)
+        if value is not None:
+            _CACHE.move_to_end(key)
+        return value
+
+def put(key: str, value: str) -> None:
+    """Remember a response, evicting the least recently used entry."""
+    with _LOCK:
+        _CACHE[key] = value
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > LLM_CACHE_SIZE:
+            _CACHE.popitem(last=False)
+
+def clear() -> None:
+    """Drop all cached responses."""
+    with _LOCK:
+        _CACHE.clear()
+        _SEMANTIC.clear()
+
+def get_cache_stats() -> Dict[str, int]:
+    """Hit and miss counts since start-up."""
+    with _LOCK:
+        return {**_stats, "entries": len(_CACHE)}
+
+def _semantic_group(messages: List[Dict[str, str]], semantic_text: str, settings: Dict[str, Any]) -> str:
+    """Key of the prompt with semantic_text removed; only prompts with the same key are compared."""
+    rest = [{**m, "content": m.get("content", "").replace(semantic_text, "")} for m in messages]
+    return make_key(rest, **settings)
+
+def _embed(client, text: str):
+    """Unit-norm embedding of text, or None if it cannot be created."""
+    try:
+        vector = np.asarray(client.create_embedding(text, model=EMBEDDING_MODEL), dtype="float32")
+    except Exception as e:
+        logger.warning(f"Semantic cache embedding failed: {e}")
+        return None
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else None
+
+def _semantic_lookup(group: str, vector) -> Optional[str]:
+    """Response of the most similar prompt in the group above the threshold."""
+    with _LOCK:
+        entries = _SEMANTIC.get(group)
+        if not entries:
+            return None
+        _SEMANTIC.move_to_end(group)
+        best_similarity, best_response = max(
+            ((float(np.dot(vector, stored)), response) for stored, response in entries if stored.shape == vector.shape),
+            default=(0.0, None),
+            key=lambda pair: pair[0]
+        )
+    if best_similarity < SEMANTIC_SIMILARITY_THRESHOLD:
+        return None
+    logger.info(f"Semantic LLM cache hit (similarity {best_similarity:.3f})")
+    return best_response
+
+def _semantic_store(group: str, vector, response: str) -> None:
+    """Remember a response under its prompt embedding."""
+    with _LOCK:
+        _SEMANTIC.setdefault(group, []).append((vector, response))
+        _SEMANTIC.move_to_end(group)
+        while sum(len(entries) for entries in _SEMANTIC.values()) > LLM_CACHE_SIZE:
+            oldest = next(iter(_SEMANTIC))
+            _SEMANTIC[oldest].pop(0)
+            if not _SEMANTIC[oldest]:
+                del _SEMANTIC[oldest]
+
+def _settings(client, temperature, max_tokens, response_format, model) -> Dict[str, Any]:
+    """Generation settings that are part of the cache key."""
+    return {
+        "model": model or getattr(client, "model", ""),
+        "t": temperature,
+        "mt": max_tokens,
+        "rf": response_format
+    }
+
+def cached_chat_completion(
+    client,
+    messages: List[Dict[str, str]],
+    temperature: float = 0.3,
+    max_tokens: Optional[int] = None,
+    response_format: Optional[Dict[str, Any]] = None,
+    model: Optional[str] = None,
+    semantic_text: Optional[str] = None
+) -> str:
+    """
+    client.chat_completion with the response cache in front of it.
+
+    semantic_text is the transcript excerpt interpolated into the messages; when
+    given (and the semantic tier is on) a prompt identical apart from a similar
+    excerpt can reuse a response. Excerpts longer than SEMANTIC_MAX_INPUT_CHARS
+    only use the exact cache.
+
+    Errors are not cached; the call raises exactly as client.chat_completion does.
+    """
+    settings = _settings(client, temperature, max_tokens, response_format, model)
+    key = make_key(messages, **settings)
+    cached = get(key)
+    if cached is not None:
+        with _LOCK:
+            _stats["hits"] += 1
+        logger.debug("LLM cache hit")
+        return cached
+
+    vector = None
+    if semantic_text and len(semantic_text) <= SEMANTIC_MAX_INPUT_CHARS and _semantic_enabled(client):
+        group = _semantic_group(messages, semantic_text, settings)
+        vector = _embed(client, semantic_text)
+        if vector is not None:
+            cached = _semantic_lookup(group, vector)
+            if cached is not None:
+                with _LOCK:
+                    _stats["semantic_hits"] += 1
+                put(key, cached)
+                return cached
+
+    with _LOCK:
+        _stats["misses"] += 1
+    response = client.chat_completion(
+        messages, temperature=temperature, max_tokens=max_tokens,
+        response_format=response_format, model=model
+    )
+    put(key, response)
+    if vector is not None:
+        _semantic_store(group, vector, response)
+    return response
+
+def cached_chat_completion_stream(
+    client,
+    messages: List[Dict[str, str]],
+    temperature: float = 0.3,
+    max_tokens: Optional[int] = None,
+    response_format: Optional[Dict[str, Any]] = None,
+    model: Optional[str] = None
+) -> Iterator[str]:
+    """
+    client.chat_completion_stream with the exact-match response cache in front of it.
+
+    A cached response is yielded as a single chunk. A streamed response is
+    cached once it has been received completely, so later streamed or
+    non-streamed calls with the same prompt reuse it.
+    """
+    key = make_key(messages, **_settings(client, temperature, max_tokens, response_format, model))
+    cached = get(key)
+    if cached is not None:
+        with _LOCK:
+            _stats["hits"] += 1
+        logger.debug("LLM cache hit")
+        yield cached
+        return
+
+    with _LOCK:
+        _stats["misses"] += 1
+    chunks = []
+    for chunk in client.chat_completion_stream(
+        messages, temperature=temperature, max_tokens=max_tokens,
+        response_format=response_format, model=model
+    ):
+        chunks.append(chunk)
+        yield chunk
+    put(key, "".join(chunks))
@@ -6,11 +6,31 @@ Day 4 Update: Production-ready client with optimized settings for all 4 AI agent
 """
 
 import os
+import io
+import atexit
+import json
+import time
+import random
 import logging
-from typing import Optional, List, Dict, Any
-from openai import OpenAI
+import threading
+import functools
+from typing import Optional, List, Dict, Any, Iterator
+import httpx
+from openai import OpenAI, APIConnectionError, APIStatusError
 from dotenv import load_dotenv
 
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
@@ -22,8 +42,17 @@ class OpenAIClient:
     """
     Enhanced wrapper class for OpenAI API interactions.
     Provides specialized methods for different AI agent processing tasks.
+
+    Chat requests failing with a transient error (connection error, timeout,
+    429 or 5xx) are retried up to RETRY_ATTEMPTS times in total, waiting a
+    random delay of up to RETRY_BASE_DELAY * 2**attempt seconds (capped at
+    RETRY_MAX_DELAY) in between.
     """
 
+    RETRY_ATTEMPTS = 3
+    RETRY_BASE_DELAY = 1.0
+    RETRY_MAX_DELAY = 10.0
+
     def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o-mini"):
         """
         Initialize OpenAI client with production settings.
@@ -42,11 +71,23 @@ class OpenAIClient:
             raise ValueError("Please replace placeholder with actual OpenAI API key in .env file")
 
         try:
+            # One keep-alive connection pool per client, shared by the agents'
+            # concurrent requests so they skip repeated TCP/TLS handshakes.
+            # Connecting gets a short timeout so an unreachable host fails fast
             self.client = OpenAI(
                 api_key=self.api_key,
-                organization=os.getenv("OPENAI_ORG_ID")  # Optional
+                organization=os.getenv("OPENAI_ORG_ID"),  # Optional
+                max_retries=0,  # Retried by _create_completion instead
+                http_client=httpx.Client(
+                    http2=HTTP2_AVAILABLE,
+                    timeout=httpx.Timeout(60.0, connect=5.0),
+                    limits=httpx.Limits(max_keepalive_connections=50, max_connections=100)
+                )
+            )
+            logger.info(
+                f"OpenAI client initialized successfully with model: {self.model} "
+                f"({'HTTP/2' if HTTP2_AVAILABLE else 'HTTP/1.1'} keep-alive pool)"
             )
-            logger.info(f"OpenAI client initialized successfully with model: {self.model}")
         except Exception as e:
             logger.error(f"Failed to initialize OpenAI client: {e}")
             raise
@@ -55,7 +96,9 @@ class OpenAIClient:
         self,
         messages: List[Dict[str, str]],
         temperature: float = 0.3,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None
     ) -> str:
         """
         Create a chat completion using OpenAI API.
@@ -64,6 +107,8 @@ class OpenAIClient:
             messages: List of message dictionaries with 'role' and 'content'
             temperature: Sampling temperature (0.0 to 1.0)
             max_tokens: Maximum tokens in response
+            response_format: Optional structured output format (e.g. {"type": "json_object"})
+            model: Model override for this request (defaults to the client's model)
 
         Returns:
             Generated text response
@@ -72,21 +117,268 @@ class OpenAIClient:
             Exception: If API call fails
         """
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens
+            response = self._create_completion(
+                messages, temperature, max_tokens, response_format, model
             )
 
             content = response.choices[0].message.content
             logger.debug(f"Successfully generated response with {len(content)} characters")
+
+            # Report prompt-cache reuse (only present for prompts of 1024+ tokens)
+            usage = getattr(response, "usage", None)
+            details = getattr(usage, "prompt_tokens_details", None)
+            cached_tokens = getattr(details, "cached_tokens", None)
+            if cached_tokens:
+                logger.debug(f"Prompt cache hit: {cached_tokens}/{usage.prompt_tokens} prompt tokens cached")
             return content
 
         except Exception as e:
             logger.error(f"OpenAI API call failed: {e}")
             raise Exception(f"Failed to generate response: {str(e)}")
 
+    def chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.3,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Create a streamed chat completion, yielding text deltas as they arrive.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens in response
+            response_format: Optional structured output format (e.g. {"type": "json_object"})
+            model: Model override for this request (defaults to the client's model)
+
+        Yields:
+            Generated text fragments in order
+
+        Raises:
+            Exception: If API call fails
+        """
+        try:
+            response = self._create_completion(
+                messages, temperature, max_tokens, response_format, model, stream=True
+            )
+
+            for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            logger.error(f"OpenAI streaming call failed: {e}")
+            raise Exception(f"Failed to generate response: {str(e)}")
+
+    def _before_request(self, messages: List[Dict[str, str]], max_tokens: Optional[int]) -> None:
+        """Hook run before every chat request attempt (e.g. to throttle)."""
+
+    def _create_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int],
+        response_format: Optional[Dict[str, Any]],
+        model: Optional[str],
+        stream: bool = False
+    ):
+        """
+        Send a chat completion request, retrying transient failures with
+        exponential backoff and full jitter.
+
+        A streamed request is only retried while it is being opened, never
+        after content has been received.
+        """
+        request_kwargs = {}
+        if response_format is not None:
+            request_kwargs["response_format"] = response_format
+        if stream:
+            request_kwargs["stream"] = True
+
+        for attempt in range(self.RETRY_ATTEMPTS):
+            self._before_request(messages, max_tokens)
+            try:
+                return self.client.chat.completions.create(
+                    model=model or self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **request_kwargs
+                )
+            except Exception as e:
+                if not is_transient_error(e) or attempt == self.RETRY_ATTEMPTS - 1:
+                    raise
+                backoff = random.uniform(0, min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** attempt))
+                logger.warning(f"Transient OpenAI error, retrying in {backoff:.1f}s (attempt {attempt + 1}/{self.RETRY_ATTEMPTS}): {e}")
+                time.sleep(backoff)
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        try:
+            self.client.close()
+        except Exception as e:
+            logger.debug(f"Failed to close OpenAI client: {e}")
+
+    def create_embedding(self, text: str, model: str = "text-embedding-3-small") -> List[float]:
+        """
+        Create an embedding vector for text.
+
+        Args:
+            text: Input text to embed
+            model: OpenAI embedding model
+
+        Returns:
+            Embedding vector
+
+        Raises:
+            Exception: If API call fails
+        """
+        try:
+            response = self.client.embeddings.create(model=model, input=text)
+            return response.data[0].embedding
+
+        except Exception as e:
+            logger.error(f"OpenAI embedding call failed: {e}")
+            raise Exception(f"Failed to create embedding: {str(e)}")
+
+    def submit_batch(
+        self,
+        requests: Dict[str, List[Dict[str, str]]],
+        temperature: float = 0.3,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Submit chat completions to the OpenAI Batch API without waiting for them.
+
+        Batch requests are billed at half price with separate, higher rate
+        limits, but complete asynchronously (within a 24h window), so this is
+        only suitable for work where latency does not matter.
+
+        Args:
+            requests: Mapping of custom_id to message list
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens per response
+            response_format: Optional structured output format
+
+        Returns:
+            Batch ID to pass to get_batch_results
+
+        Raises:
+            Exception: If the batch could not be created
+        """
+        try:
+            lines = []
+            for custom_id, messages in requests.items():
+                body = {"model": self.model, "messages": messages, "temperature": temperature}
+                if max_tokens is not None:
+                    body["max_tokens"] = max_tokens
+                if response_format is not None:
+                    body["response_format"] = response_format
+                lines.append(json.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body
+                }))
+
+            batch_file = self.client.files.create(
+                file=("batch_requests.jsonl", io.BytesIO("\n".join(lines).encode("utf-8"))),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            logger.info(f"Submitted batch {batch.id} with {len(lines)} requests")
+            return batch.id
+
+        except Exception as e:
+            logger.error(f"OpenAI batch submission failed: {e}")
+            raise Exception(f"Failed to submit batch: {str(e)}")
+
+    def get_batch_results(
+        self,
+        batch_id: str,
+        poll_interval: float = 30.0,
+        timeout: Optional[float] = None
+    ) -> Dict[str, str]:
+        """
+        Wait for a submitted batch and return its successful responses.
+
+        Args:
+            batch_id: ID returned by submit_batch
+            poll_interval: Seconds between batch status checks
+            timeout: Give up waiting after this many seconds (None waits for the batch window)
+
+        Returns:
+            Mapping of custom_id to generated text (failed requests are omitted)
+
+        Raises:
+            Exception: If the batch failed or timed out
+        """
+        try:
+            batch = self.client.batches.retrieve(batch_id)
+            started = time.time()
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                if timeout is not None and time.time() - started >= timeout:
+                    raise TimeoutError(f"batch {batch_id} still {batch.status} after {timeout:.0f}s")
+                time.sleep(poll_interval)
+                batch = self.client.batches.retrieve(batch_id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise RuntimeError(f"batch {batch_id} ended with status {batch.status}")
+
+            results: Dict[str, str] = {}
+            for line in self.client.files.content(batch.output_file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response = record.get("response") or {}
+                if response.get("status_code") == 200:
+                    results[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+
+            logger.info(f"Batch {batch_id} completed: {len(results)} succeeded")
+            return results
+
+        except Exception as e:
+            logger.error(f"OpenAI batch retrieval failed: {e}")
+            raise Exception(f"Failed to get batch results: {str(e)}")
+
+    def batch_chat_completions(
+        self,
+        requests: Dict[str, List[Dict[str, str]]],
+        temperature: float = 0.3,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        poll_interval: float = 30.0,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        Run many chat completions through the OpenAI Batch API and wait for them.
+
+        Args:
+            requests: Mapping of custom_id to message list
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens per response
+            response_format: Optional structured output format
+            poll_interval: Seconds between batch status checks
+            timeout: Give up waiting after this many seconds (None waits for the batch window)
+
+        Returns:
+            Mapping of custom_id to generated text (None for requests that failed)
+
+        Raises:
+            Exception: If the batch could not be created, failed, or timed out
+        """
+        batch_id = self.submit_batch(requests, temperature, max_tokens, response_format)
+        results = self.get_batch_results(batch_id, poll_interval, timeout)
+        return {custom_id: results.get(custom_id) for custom_id in requests}
+
     def process_transcript(self, transcript: str) -> str:
         """
         Clean and process a meeting transcript using AI.
@@ -388,20 +680,135 @@ Generate 3-5 strategic insights about this meeting."""
 
         return self.chat_completion(messages, temperature=0.3, max_tokens=600)
 
-# Singleton instance for easy access
-openai_client = None
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Whether a failed OpenAI request is worth retrying.
+
+    Connection errors, timeouts, 429 and 5xx responses are transient; other
+    4xx responses (bad request, auth, not found) are not. The client methods
+    re-raise a plain Exception, so the original OpenAI error is looked up in
+    its context.
+    """
+    cause = error if isinstance(error, (APIConnectionError, APIStatusError)) else error.__context__
+    if isinstance(cause, APIConnectionError):
+        return True
+    if isinstance(cause, APIStatusError):
+        return cause.status_code == 429 or cause.status_code >= 500
+    return False
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding():
+    """The gpt-4o-mini tokenizer, or None when tiktoken or its encoding data is unavailable."""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.encoding_for_model("gpt-4o-mini")
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable, estimating rate limit tokens from characters: {e}")
+        return None
+
+class _TokenBucket:
+    """Thread-safe token bucket refilled continuously up to a per-minute capacity."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.available = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1.0) -> None:
+        """Block until amount units are available, then consume them."""
+        amount = min(float(amount), self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.available >= amount:
+                    self.available -= amount
+                    return
+                wait = (amount - self.available) / self.rate
+            time.sleep(wait)
+
+class RateLimitedClient(OpenAIClient):
+    """
+    OpenAIClient that throttles requests to stay under OpenAI rate limits.
+
+    Every chat completion first takes one request from a requests-per-minute
+    bucket and its estimated token cost from a tokens-per-minute bucket, so
+    concurrent agents and bulk meeting processing queue up instead of bursting
+    into 429 errors. Requests that still fail transiently are retried with a
+    larger budget than the base client, since bulk runs can wait longer.
+    """
+
+    RETRY_ATTEMPTS = 5
+    RETRY_MAX_DELAY = 60.0
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gpt-4o-mini",
+        requests_per_minute: float = 500,
+        tokens_per_minute: float = 200000
+    ):
+        """
+        Initialize the client and its rate limit buckets.
+
+        Args:
+            api_key: OpenAI API key (if not provided, loads from environment)
+            model: OpenAI model to use
+            requests_per_minute: Maximum requests per minute
+            tokens_per_minute: Maximum prompt + completion tokens per minute
+        """
+        super().__init__(api_key=api_key, model=model)
+        self._request_bucket = _TokenBucket(requests_per_minute)
+        self._token_bucket = _TokenBucket(tokens_per_minute)
 
+    @staticmethod
+    def estimate_tokens(messages: List[Dict[str, str]], max_tokens: Optional[int] = None) -> int:
+        """
+        Token cost of a request as counted against the TPM limit: prompt tokens
+        plus the completion budget.
+
+        Prompt tokens are counted with tiktoken when installed (including the
+        few tokens of framing per message), otherwise estimated at ~4 characters
+        per token.
+        """
+        encoding = _get_encoding()
+        if encoding is None:
+            prompt_chars = sum(len(message.get("content", "")) for message in messages)
+            return prompt_chars // 4 + (max_tokens or 0)
+        prompt_tokens = sum(len(encoding.encode(message.get("content", ""))) + 3 for message in messages) + 3
+        return prompt_tokens + (max_tokens or 0)
+
+    def _before_request(self, messages: List[Dict[str, str]], max_tokens: Optional[int]) -> None:
+        """Wait for capacity in both buckets."""
+        self._request_bucket.acquire(1)
+        self._token_bucket.acquire(self.estimate_tokens(messages, max_tokens))
+
+@functools.lru_cache(maxsize=1)
 def get_openai_client() -> OpenAIClient:
     """
-    Get or create OpenAI client instance.
+    Get the process-wide OpenAI client instance (created on first use).
+
+    The client's connection pool is closed when the interpreter exits.
 
     Returns:
         OpenAIClient instance
     """
-    global openai_client
-    if openai_client is None:
-        openai_client = OpenAIClient()
-    return openai_client
+    # Throttle all agents when rate limits are configured (e.g. bulk processing)
+    rpm = os.getenv("OPENAI_MAX_REQUESTS_PER_MINUTE")
+    tpm = os.getenv("OPENAI_MAX_TOKENS_PER_MINUTE")
+    if rpm or tpm:
+        client = RateLimitedClient(
+            requests_per_minute=float(rpm or 500),
+            tokens_per_minute=float(tpm or 200000)
+        )
+    else:
+        client = OpenAIClient()
+    atexit.register(client.close)
+    return client
 
 def test_openai_connection() -> bool:
     """
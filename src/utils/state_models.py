@@ -69,6 +69,8 @@ class MeetingState(TypedDict):
     current_agent: Optional[str]                  # Which agent is currently processing
     agent_statuses: Optional[Dict[str, str]]      # Status of each agent
     progress_percentage: Optional[int]            # Progress indicator (0-100)
+    batch_mode: Optional[bool]                    # Latency-tolerant: analyze via the OpenAI Batch API
+    minutes_batch_id: Optional[str]               # Pending Batch API job for the formatted minutes
 
     # ================================
     # ERROR HANDLING AND LOGGING
@@ -199,6 +201,8 @@ def create_initial_state(
             "minutes_formatter": "waiting"
         },
         progress_percentage=0,
+        batch_mode=False,
+        minutes_batch_id=None,
 
         # Error handling
         errors=[],
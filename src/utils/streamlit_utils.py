@@ -10,6 +10,7 @@ import base64
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
 from io import StringIO
+from types import MappingProxyType
 import logging
 
 logger = logging.getLogger(__name__)
@@ -26,7 +27,8 @@ def load_sample_data():
         from sample_data.sample_transcripts import get_all_sample_keys, get_sample_titles, get_sample_transcript
 
         sample_keys = get_all_sample_keys()
-        sample_titles = get_sample_titles()
+        # Copied so the cached return value stays picklable
+        sample_titles = dict(get_sample_titles())
         samples = {}
 
         for key in sample_keys:
@@ -49,9 +51,15 @@ def get_system_status_cached():
         from utils.openai_client import get_api_status
         from agents import get_system_status
 
+        # st.cache_data pickles the result, and the shared status is a read-only mappingproxy
+        system_status = {
+            key: dict(value) if isinstance(value, MappingProxyType) else value
+            for key, value in get_system_status().items()
+        }
+
         return {
             "api_status": get_api_status(),
-            "system_status": get_system_status(),
+            "system_status": system_status,
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
@@ -21,7 +21,7 @@ from utils.state_models import (
 from agents.transcript_processor import process_transcript
 from agents.content_analyzer import analyze_content
 from agents.summary_writer import write_summary
-from agents.minutes_formatter import format_minutes
+from agents.minutes_formatter import format_minutes, format_minutes_batch
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -233,6 +233,15 @@ class MeetingMinutesWorkflow:
             # Update status to processing
             state = update_agent_status(state, agent_name, "processing", 85)
 
+            # Batch mode defers formatting to the Batch API (collected with finalize_minutes_from_batch)
+            if state.get("batch_mode"):
+                result_state = format_minutes_batch(state)
+                processing_time = time.time() - start_time
+                result_state = update_agent_status(result_state, agent_name, "pending", 90, processing_time)
+                result_state["processing_status"] = "pending_batch"
+                logger.info(f"⏳ {agent_name} submitted batch {result_state['minutes_batch_id']}")
+                return result_state
+
             # Call the actual agent
             result_state = format_minutes(state)
 